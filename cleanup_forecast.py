@@ -21,10 +21,16 @@ Note: Recurring transactions without a memo are skipped.
 import os
 import sys
 import argparse
+import hashlib
+import json
+import random
+import threading
 import time
-from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
 from dotenv import load_dotenv
+import urllib3
 import ynab
 from ynab.exceptions import ApiException
 from ynab.models.scheduled_transaction_frequency import ScheduledTransactionFrequency
@@ -32,28 +38,74 @@ from ynab.models.scheduled_transaction_frequency import ScheduledTransactionFreq
 # Configuration
 FORECAST_MONTHS = 2
 FORECAST_PREFIX = "🔮 Forecast"
-# Proactive rate limiting: YNAB allows 200 requests/hour
-# Using 2 second delays between writes = max 30 writes/minute = 1800/hour (safe margin)
-API_DELAY_SECONDS = 2.0
-RATE_LIMIT_RETRY_SECONDS = 65  # Wait slightly over a minute if rate limited
-
-
-def get_frequency_step(frequency: str) -> relativedelta | None:
-    """Returns the relativedelta step for a given YNAB frequency."""
-    frequency_map = {
-        'daily': relativedelta(days=1),
-        'weekly': relativedelta(weeks=1),
-        'everyOtherWeek': relativedelta(weeks=2),
-        'every4Weeks': relativedelta(weeks=4),
-        'monthly': relativedelta(months=1),
-        'everyOtherMonth': relativedelta(months=2),
-        'every3Months': relativedelta(months=3),
-        'every4Months': relativedelta(months=4),
-        'twiceAYear': relativedelta(months=6),
-        'yearly': relativedelta(years=1),
-        'everyOtherYear': relativedelta(years=2),
-    }
-    return frequency_map.get(frequency)
+# Proactive rate limiting: YNAB allows 200 requests/hour. A token bucket
+# lets bursts within that budget run at network speed and only sleeps when
+# the hourly quota is actually threatened.
+REQUESTS_PER_HOUR = 190
+# Rate-limit retries back off exponentially with full jitter: base doubles
+# per attempt, the actual sleep is uniform in [0, base]. Jitter spreads out
+# retries when several runs share the same quota.
+RATE_LIMIT_BACKOFF_BASE_SECONDS = 65
+RATE_LIMIT_BACKOFF_CAP_SECONDS = 300
+# Creates and deletes are independent of each other, so they can be issued
+# concurrently. urllib3's connection pool inside ApiClient is thread-safe.
+API_WORKERS = 8
+# Print write progress in chunks rather than per item: per-item prints
+# flush stdout on every call and dominate runtime once writes overlap.
+PROGRESS_EVERY = 25
+# Delta sync cache: stores YNAB server_knowledge plus the scheduled
+# transactions it corresponds to, so subsequent runs only fetch changes.
+CACHE_FILE = ".ynab_cache.json"
+# Do a full (non-delta) fetch every N runs to recover from any cache drift.
+FULL_REFRESH_EVERY = 10
+
+
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks only when the bucket is empty."""
+
+    def __init__(self, rate_per_hour: int = REQUESTS_PER_HOUR):
+        self.rate = rate_per_hour / 3600.0
+        self.capacity = float(rate_per_hour)
+        self.tokens = float(rate_per_hour)
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Step per YNAB frequency, built once at import time (constructing a
+# relativedelta is not free, and the steps never change). Fixed-day
+# frequencies use timedelta, whose date addition is a C fast path;
+# relativedelta is kept only where calendar arithmetic matters.
+_FREQ_STEP = {
+    'daily': timedelta(days=1),
+    'weekly': timedelta(days=7),
+    'everyOtherWeek': timedelta(days=14),
+    'every4Weeks': timedelta(days=28),
+    'monthly': relativedelta(months=1),
+    'everyOtherMonth': relativedelta(months=2),
+    'every3Months': relativedelta(months=3),
+    'every4Months': relativedelta(months=4),
+    'twiceAYear': relativedelta(months=6),
+    'yearly': relativedelta(years=1),
+    'everyOtherYear': relativedelta(years=2),
+}
+
+
+def get_frequency_step(frequency: str) -> relativedelta | timedelta | None:
+    """Returns the step for a given YNAB frequency."""
+    return _FREQ_STEP.get(frequency)
 
 
 def generate_twice_a_month_dates(start_date: date, horizon_date: date) -> list[date]:
@@ -93,20 +145,134 @@ def generate_twice_a_month_dates(start_date: date, horizon_date: date) -> list[d
     return sorted(dates)
 
 
+def load_cache(budget_id: str) -> dict:
+    """Load the cached state for a budget. Returns {} if missing or unreadable."""
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f).get(budget_id, {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(budget_id: str, cache: dict) -> None:
+    """Persist the cached state for a budget, keeping other budgets intact."""
+    try:
+        with open(CACHE_FILE) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    data[budget_id] = cache
+    with open(CACHE_FILE, "w") as f:
+        json.dump(data, f)
+
+
+def merge_delta(cached: list[dict], changed) -> list[dict]:
+    """
+    Merge a delta response's changed scheduled transactions into the cached
+    list. Changed entities replace cached ones by id; entities the server
+    reports as deleted are dropped.
+    """
+    by_id = {s['id']: s for s in cached}
+    for sched in changed:
+        as_dict = json.loads(sched.to_json())
+        if as_dict.get('deleted'):
+            by_id.pop(as_dict['id'], None)
+        else:
+            by_id[as_dict['id']] = as_dict
+    return list(by_id.values())
+
+
+def state_fingerprint(masters, forecast_sigs, horizon_date: date) -> str:
+    """
+    Hash everything the desired-forecast diff depends on: the recurring
+    masters, the forecast (date, payee, amount) signatures, and the horizon.
+    A fully synced run records the fingerprint of the state it left behind;
+    if a later run's inputs produce the same fingerprint, the budget already
+    matches the desired state and the compute/write phase can be skipped.
+    """
+    masters_part = sorted(
+        (str(m.id), m.date_next.isoformat() if m.date_next else "",
+         m.frequency, m.amount, m.payee_name or "", m.memo or "",
+         str(m.account_id), str(m.category_id), str(m.flag_color))
+        for m in masters
+    )
+    # Deduplicate before sorting: the diff is signature-keyed, so two masters
+    # producing the same (date, payee, amount) yield one forecast entity, and
+    # both sides of the comparison must fingerprint that same set.
+    payload = repr((masters_part, sorted(set(forecast_sigs)), horizon_date.isoformat()))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
 def api_call_with_retry(func, *args, max_retries: int = 3, **kwargs):
-    """Execute an API call with retry logic for rate limits."""
+    """Execute an API call, retrying rate limits with jittered backoff."""
     for attempt in range(max_retries):
         try:
             return func(*args, **kwargs)
         except ApiException as e:
             if e.status == 429 and attempt < max_retries - 1:
-                print(f"   Rate limit hit. Waiting {RATE_LIMIT_RETRY_SECONDS}s... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(RATE_LIMIT_RETRY_SECONDS)
+                delay = random.uniform(0, min(
+                    RATE_LIMIT_BACKOFF_CAP_SECONDS,
+                    RATE_LIMIT_BACKOFF_BASE_SECONDS * 2 ** attempt
+                ))
+                print(f"   Rate limit hit. Backing off {delay:.0f}s... (attempt {attempt + 1}/{max_retries})")
+                time.sleep(delay)
             else:
                 raise
     return None
 
 
+class Progress:
+    """Thread-safe completion counter printing every PROGRESS_EVERY items."""
+
+    def __init__(self, label: str, total: int):
+        self.label = label
+        self.total = total
+        self.done = 0
+        self._lock = threading.Lock()
+
+    def tick(self) -> None:
+        with self._lock:
+            self.done += 1
+            if self.done % PROGRESS_EVERY == 0 or self.done == self.total:
+                print(f"   {self.label}: {self.done}/{self.total}")
+
+
+def safe_delete(api, budget_id: str, item, bucket: TokenBucket, progress: Progress) -> bool:
+    """
+    Delete a single scheduled transaction, drawing from the shared rate
+    limiter so the aggregate request rate stays within the hourly quota.
+    Returns True on success.
+    """
+    bucket.acquire()
+    try:
+        api_call_with_retry(api.delete_scheduled_transaction, budget_id, item.id)
+        progress.tick()
+        return True
+    except ApiException as e:
+        print(f"   Failed to delete {item.date_next} | {item.payee_name}: {e}")
+        return False
+
+
+def safe_create(api, budget_id: str, item: dict, payload, bucket: TokenBucket,
+                progress: Progress) -> bool:
+    """
+    Create a single scheduled transaction, drawing from the shared rate
+    limiter. Returns True on success.
+    """
+    bucket.acquire()
+    try:
+        api_call_with_retry(
+            api.create_scheduled_transaction,
+            budget_id,
+            ynab.PostScheduledTransactionWrapper(scheduled_transaction=payload)
+        )
+        progress.tick()
+        return True
+    except ApiException as e:
+        print(f"   Failed to create {item['date']} | {item['payee_name']}: {e}")
+        return False
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="YNAB Forecast Manager")
     parser.add_argument("--dry-run", action="store_true", 
@@ -127,7 +293,18 @@ def main() -> int:
         return 1
 
     configuration = ynab.Configuration(access_token=token)
-    
+    # Size the connection pool for the worker threads so concurrent calls
+    # reuse kept-alive TLS connections instead of handshaking new ones, and
+    # let urllib3 retry transient server errors transparently. 429s are
+    # handled at the application level (api_call_with_retry + TokenBucket).
+    configuration.connection_pool_maxsize = API_WORKERS * 2
+    configuration.retries = urllib3.Retry(
+        total=3,
+        backoff_factor=1.5,
+        status_forcelist=[500, 502, 503, 504],
+    )
+
+
     today = date.today()
     horizon_date = today + relativedelta(months=FORECAST_MONTHS)
     
@@ -147,39 +324,116 @@ def main() -> int:
         scheduled_transactions_api = ynab.ScheduledTransactionsApi(api_client)
 
         try:
-            # --- STEP 1: Fetch Scheduled Transactions ---
-            print("Fetching scheduled transactions...")
-            
-            sched_response = api_call_with_retry(
-                scheduled_transactions_api.get_scheduled_transactions,
-                budget_id
-            )
+            # --- STEP 1: Fetch Scheduled Transactions (delta when possible) ---
+            cache = load_cache(budget_id)
+            prev_knowledge = cache.get('server_knowledge')
+            runs_since_refresh = cache.get('runs_since_refresh', 0)
+            use_delta = (prev_knowledge is not None
+                         and cache.get('scheduled_transactions') is not None
+                         and runs_since_refresh < FULL_REFRESH_EVERY)
+
+            if use_delta:
+                print(f"Fetching scheduled transaction changes (since knowledge {prev_knowledge})...")
+                sched_response = api_call_with_retry(
+                    scheduled_transactions_api.get_scheduled_transactions,
+                    budget_id,
+                    last_knowledge_of_server=prev_knowledge
+                )
+            else:
+                print("Fetching scheduled transactions (full refresh)...")
+                sched_response = api_call_with_retry(
+                    scheduled_transactions_api.get_scheduled_transactions,
+                    budget_id
+                )
             if sched_response is None:
                 print("Error: Failed to fetch scheduled transactions after retries")
                 return 1
-                
-            all_scheduled = sched_response.data.scheduled_transactions
+
+            changed = sched_response.data.scheduled_transactions
+            if use_delta:
+                print(f"   {len(changed)} changed since last run")
+                cached_scheduled = merge_delta(cache['scheduled_transactions'], changed)
+                runs_since_refresh += 1
+            else:
+                cached_scheduled = [json.loads(s.to_json()) for s in changed]
+                runs_since_refresh = 0
+
+            all_scheduled = [
+                ynab.ScheduledTransactionDetail.from_dict(d) for d in cached_scheduled
+            ]
+            cache.update({
+                'server_knowledge': sched_response.data.server_knowledge,
+                'scheduled_transactions': cached_scheduled,
+                'runs_since_refresh': runs_since_refresh,
+            })
+            save_cache(budget_id, cache)
             print(f"Found {len(all_scheduled)} scheduled transactions")
 
-            # --- STEP 2: Generate Desired Forecasts (In-Memory) ---
-            print("\nCalculating desired forecasts...")
-            desired_forecasts: list[dict] = []
-            
+            # If nothing changed server-side since the last fully synced run
+            # and the horizon hasn't advanced, the budget already matches the
+            # desired state - skip the compute and write phases entirely.
+            # This compares against the knowledge recorded by a *successful*
+            # sync, not the plain cursor stored above, which advances on
+            # every fetch including dry runs and runs whose writes failed.
+            # Dry runs fall through so they always show the full plan.
+            if (not args.dry_run
+                    and sched_response.data.server_knowledge == cache.get('synced_server_knowledge')
+                    and cache.get('synced_horizon') == horizon_date.isoformat()):
+                print("\nNo server changes since last sync and horizon unchanged; nothing to do.")
+                return 0
+
+            # --- STEP 2: Classify Scheduled Transactions (single pass) ---
+            print("\nClassifying scheduled transactions...")
+            masters = []             # recurring transactions to forecast from
+            existing_forecasts = []  # previously generated one-time forecasts
+
             for sched in all_scheduled:
-                # Skip deleted or one-time transactions
-                if sched.deleted or sched.frequency == 'never':
+                if sched.deleted:
                     continue
-                
-                # Skip transactions that already are forecasts (avoid recursion)
+                # Cheapest discriminator first: generated forecasts always
+                # carry the prefix at the start of the payee, so a single
+                # startswith settles most entries once forecasts exist.
+                if (sched.payee_name or "").startswith(FORECAST_PREFIX):
+                    # One-time prefixed entries are our forecasts; recurring
+                    # ones are skipped to avoid forecasting a forecast.
+                    if sched.frequency == 'never':
+                        existing_forecasts.append(sched)
+                elif sched.frequency != 'never':
+                    masters.append(sched)
+
+            print(f"   Found {len(masters)} recurring masters and "
+                  f"{len(existing_forecasts)} existing forecast transactions")
+
+            # If the inputs to the diff match what the last fully synced run
+            # saw, that run already produced exactly this state - skip the
+            # generation, diff, and write phases. Dry runs fall through so
+            # they always show the full plan.
+            existing_sig_list = [
+                (e.date_next.isoformat(), e.payee_name or "", e.amount)
+                for e in existing_forecasts
+            ]
+            fingerprint = state_fingerprint(masters, existing_sig_list, horizon_date)
+            if not args.dry_run and cache.get('synced_fingerprint') == fingerprint:
+                # A fingerprint match proves the budget is synced, so this
+                # fetch's knowledge becomes a valid cursor for the cheaper
+                # STEP 1 skip on the next run.
+                cache['synced_server_knowledge'] = sched_response.data.server_knowledge
+                cache['synced_horizon'] = horizon_date.isoformat()
+                save_cache(budget_id, cache)
+                print("\nMasters and forecasts unchanged since last sync; nothing to do.")
+                return 0
+
+            # --- STEP 3: Generate Desired Forecasts (In-Memory) ---
+            print("\nCalculating desired forecasts...")
+            desired_forecasts: list[dict] = []
+
+            for sched in masters:
                 original_payee = sched.payee_name or ""
-                if FORECAST_PREFIX in original_payee:
-                    continue
-                
-                # Check for split transactions (subtransactions)
-                has_splits = (hasattr(sched, 'subtransactions') and 
-                              sched.subtransactions and 
-                              len(sched.subtransactions) > 0)
-                if has_splits:
+
+                # Check for split transactions (subtransactions); the SDK
+                # model always defines the attribute, and None and an empty
+                # list are both falsy.
+                if sched.subtransactions:
                     print(f"   Warning: Skipping split transaction '{original_payee}' "
                           f"(YNAB API doesn't support creating split scheduled transactions)")
                     skipped_splits += 1
@@ -206,7 +460,7 @@ def main() -> int:
                 if sched.frequency == 'twiceAMonth':
                     if sched.date_next:
                         future_dates = generate_twice_a_month_dates(
-                            sched.date_next + relativedelta(days=1),  # Start after next scheduled
+                            sched.date_next + timedelta(days=1),  # Start after next scheduled
                             horizon_date
                         )
                         for fut_date in future_dates:
@@ -228,9 +482,23 @@ def main() -> int:
                     continue
                     
                 start_date = sched.date_next + step
-                curr_date = start_date
-                
-                while curr_date <= horizon_date:
+
+                if isinstance(step, timedelta):
+                    # Fixed-day steps: the occurrence count is known up front,
+                    # so build the dates in one comprehension instead of
+                    # stepping and comparing per iteration.
+                    n = (horizon_date - start_date).days // step.days + 1
+                    future_dates = [
+                        start_date + timedelta(days=step.days * i) for i in range(n)
+                    ]
+                else:
+                    future_dates = []
+                    curr_date = start_date
+                    while curr_date <= horizon_date:
+                        future_dates.append(curr_date)
+                        curr_date = curr_date + step
+
+                for curr_date in future_dates:
                     desired_forecasts.append({
                         "date": curr_date,
                         "payee_name": forecast_payee,
@@ -240,57 +508,38 @@ def main() -> int:
                         "memo": f"{forecast_payee} ({sched.frequency})",
                         "flag_color": sched.flag_color,
                     })
-                    curr_date = curr_date + step
 
             print(f"   Calculated {len(desired_forecasts)} desired forecast entries")
             if skipped_splits > 0:
                 print(f"   Skipped {skipped_splits} split transactions")
 
-            # --- STEP 3: Identify Existing Forecasts ---
-            print("\nIdentifying existing forecasts...")
-            existing_forecasts = []
-            for sched in all_scheduled:
-                if sched.deleted:
-                    continue
-                payee_name = sched.payee_name or ""
-                memo = sched.memo or ""
-                # Match forecasts by prefix in payee
-                is_forecast = FORECAST_PREFIX in payee_name
-                
-                if is_forecast and sched.frequency == 'never':
-                    existing_forecasts.append(sched)
-            
-            print(f"   Found {len(existing_forecasts)} existing forecast transactions")
-
             # --- STEP 4: Calculate Delta (Diff) ---
             print("\nCalculating delta...")
             
-            # Create signature sets for comparison: "YYYY-MM-DD|Payee|Amount"
-            def make_signature(dt: date, payee: str, amount: int) -> str:
-                return f"{dt}|{payee}|{amount}"
-            
-            desired_sigs: dict[str, dict] = {
-                make_signature(d['date'], d['payee_name'], d['amount']): d 
+            # Signatures for comparison: (date, payee, amount) tuples hash
+            # directly, with no per-entry string formatting.
+            desired_sigs: dict[tuple, dict] = {
+                (d['date'], d['payee_name'], d['amount']): d
                 for d in desired_forecasts
             }
-            
+
             existing_sigs = {
-                make_signature(e.date_next, e.payee_name, e.amount): e 
+                (e.date_next, e.payee_name, e.amount): e
                 for e in existing_forecasts
             }
-            
+
+            # Dict key views support set algebra in C, so the diff needs no
+            # per-entry membership tests.
             # To DELETE: existing items not in desired
             to_delete = [
-                existing_sigs[sig] 
-                for sig in existing_sigs 
-                if sig not in desired_sigs
+                existing_sigs[sig]
+                for sig in existing_sigs.keys() - desired_sigs.keys()
             ]
-            
-            # To CREATE: desired items not in desired
+
+            # To CREATE: desired items not in existing
             to_create = [
-                desired_sigs[sig] 
-                for sig in desired_sigs 
-                if sig not in existing_sigs
+                desired_sigs[sig]
+                for sig in desired_sigs.keys() - existing_sigs.keys()
             ]
             
             unchanged = len(desired_forecasts) - len(to_create)
@@ -299,72 +548,90 @@ def main() -> int:
             print(f"   To create: {len(to_create)}")
             print(f"   Unchanged: {unchanged}")
 
-            # Estimate time for API calls
             total_api_calls = len(to_delete) + len(to_create)
-            if total_api_calls > 0:
-                estimated_time = total_api_calls * API_DELAY_SECONDS
-                print(f"\n   Estimated time: ~{int(estimated_time)}s ({total_api_calls} API calls at {API_DELAY_SECONDS}s intervals)")
+            if total_api_calls > REQUESTS_PER_HOUR:
+                print(f"\n   Note: {total_api_calls} API calls exceed the hourly "
+                      f"budget of {REQUESTS_PER_HOUR}; the rate limiter will throttle.")
+
+            rate_bucket = TokenBucket()
 
             # --- STEP 5: Execute Deletes ---
             if to_delete:
                 print(f"\nDeleting {len(to_delete)} obsolete forecasts...")
-                for i, item in enumerate(to_delete, 1):
-                    if args.dry_run:
+                if args.dry_run:
+                    for i, item in enumerate(to_delete, 1):
                         print(f"   [{i}/{len(to_delete)}] Would delete: {item.date_next} | {item.payee_name}")
-                    else:
-                        print(f"   [{i}/{len(to_delete)}] Deleting: {item.date_next} | {item.payee_name}")
-                        try:
-                            api_call_with_retry(
-                                scheduled_transactions_api.delete_scheduled_transaction,
-                                budget_id, 
-                                item.id
-                            )
-                            deleted_forecast_count += 1
-                            time.sleep(API_DELAY_SECONDS)
-                        except ApiException as e:
-                            print(f"      Failed to delete: {e}")
+                else:
+                    progress = Progress("deleted", len(to_delete))
+                    with ThreadPoolExecutor(max_workers=API_WORKERS) as executor:
+                        results = list(executor.map(
+                            lambda item: safe_delete(
+                                scheduled_transactions_api, budget_id, item,
+                                rate_bucket, progress
+                            ),
+                            to_delete
+                        ))
+                    deleted_forecast_count = sum(results)
             
             # --- STEP 6: Execute Creates ---
             if to_create:
+                # Build all payloads up front. The YNAB API only accepts one
+                # scheduled transaction per POST (there is no bulk endpoint
+                # for scheduled transactions), so sending stays per-item.
+                batch = []
+                for item in to_create:
+                    # For inflows (positive amounts), omit category_id
+                    # (goes to "Ready to Assign" automatically)
+                    category_id = None if item['amount'] > 0 else item['category_id']
+
+                    batch.append((item, ynab.SaveScheduledTransaction(
+                        account_id=item['account_id'],
+                        date=item['date'],
+                        amount=item['amount'],
+                        payee_name=item['payee_name'],
+                        category_id=category_id,
+                        memo=item['memo'],
+                        frequency=ScheduledTransactionFrequency.NEVER,
+                        flag_color=item['flag_color'],
+                    )))
+
                 print(f"\nCreating {len(to_create)} new forecasts...")
-                for i, item in enumerate(to_create, 1):
-                    if args.dry_run:
+                if args.dry_run:
+                    for i, (item, new_sched) in enumerate(batch, 1):
                         print(f"   [{i}/{len(to_create)}] Would create: {item['date']} | {item['payee_name']}")
-                    else:
-                        print(f"   [{i}/{len(to_create)}] Creating: {item['date']} | {item['payee_name']}")
-                        try:
-                            # For inflows (positive amounts), omit category_id
-                            # (goes to "Ready to Assign" automatically)
-                            category_id = None if item['amount'] > 0 else item['category_id']
-                            
-                            new_sched = ynab.SaveScheduledTransaction(
-                                account_id=item['account_id'],
-                                date=item['date'],
-                                amount=item['amount'],
-                                payee_name=item['payee_name'],
-                                category_id=category_id,
-                                memo=item['memo'],
-                                frequency=ScheduledTransactionFrequency.NEVER,
-                                flag_color=item['flag_color'],
-                            )
-                            
-                            wrapper = ynab.PostScheduledTransactionWrapper(
-                                scheduled_transaction=new_sched
-                            )
-                            api_call_with_retry(
-                                scheduled_transactions_api.create_scheduled_transaction,
-                                budget_id,
-                                wrapper
-                            )
-                            created_count += 1
-                            time.sleep(API_DELAY_SECONDS)
-                            
-                        except ApiException as e:
-                            print(f"      Failed to create: {e}")
-                            if e.status == 429:
-                                print(f"      Rate limit exceeded. Stopping to avoid further issues.")
-                                print(f"      Run the script again later to continue.")
-                                break
+                else:
+                    progress = Progress("created", len(to_create))
+                    with ThreadPoolExecutor(max_workers=API_WORKERS) as executor:
+                        results = list(executor.map(
+                            lambda pair: safe_create(
+                                scheduled_transactions_api, budget_id,
+                                pair[0], pair[1], rate_bucket, progress
+                            ),
+                            batch
+                        ))
+                    created_count = sum(results)
+
+            # Record the horizon this run fully synced to, so an unchanged
+            # follow-up run can no-op early. Skipped on dry runs and when any
+            # write failed, since the budget then doesn't match the desired
+            # state yet.
+            if (not args.dry_run
+                    and deleted_forecast_count == len(to_delete)
+                    and created_count == len(to_create)):
+                # Pre-write knowledge: the next run's delta will still pick
+                # up this run's own writes before the cursor catches up.
+                cache['synced_server_knowledge'] = sched_response.data.server_knowledge
+                cache['synced_horizon'] = horizon_date.isoformat()
+                # After a full sync the existing forecasts equal the desired
+                # signature set, so fingerprint the state this run left
+                # behind from the (already deduplicated) signature keys.
+                cache['synced_fingerprint'] = state_fingerprint(
+                    masters,
+                    [(d.isoformat(), payee, amount)
+                     for (d, payee, amount) in desired_sigs],
+                    horizon_date
+                )
+                save_cache(budget_id, cache)
 
         except ApiException as e:
             print(f"\nAPI Error: {e}")